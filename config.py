@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -61,6 +62,12 @@ class Settings:
     model: str = field(default_factory=lambda: _env("NLP_MODEL", "distilbert-base-uncased-finetuned-sst-2-english"))
     device: int = field(default_factory=lambda: _env_int("NLP_DEVICE", -1))
     top_k: int = field(default_factory=lambda: _env_int("NLP_TOP_K", 1))
+    use_onnx: bool = field(default_factory=lambda: _env_bool("NLP_USE_ONNX", False))
+    onnx_cache_dir: str = field(
+        default_factory=lambda: _env(
+            "NLP_ONNX_CACHE_DIR", str(Path.home() / ".cache" / "nlp-sentiment" / "onnx")
+        )
+    )
 
     # -- Web server ----------------------------------------------------------
     host: str = field(default_factory=lambda: _env("NLP_HOST", "127.0.0.1"))
@@ -72,10 +79,18 @@ class Settings:
     max_text_length: int = field(default_factory=lambda: _env_int("NLP_MAX_TEXT_LENGTH", 5000))
     request_timeout: int = field(default_factory=lambda: _env_int("NLP_REQUEST_TIMEOUT", 30))
 
+    # -- Batching ------------------------------------------------------------
+    batch_wait_ms: int = field(default_factory=lambda: _env_int("NLP_BATCH_WAIT_MS", 5))
+
     # -- Misc ----------------------------------------------------------------
     log_level: str = field(default_factory=lambda: _env("NLP_LOG_LEVEL", "INFO"))
     debug: bool = field(default_factory=lambda: _env_bool("NLP_DEBUG", False))
 
+    @cached_property
+    def origins_list(self) -> tuple[str, ...]:
+        """``cors_origins`` split into individual origins (parsed once)."""
+        return tuple(o.strip() for o in self.cors_origins.split(",") if o.strip())
+
 
 # Singleton — importable from anywhere as ``from config import settings``.
 settings = Settings()
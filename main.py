@@ -3,7 +3,7 @@ import logging
 import sys
 import uvicorn
 
-from cli import run_repl, build_pipeline
+from cli import PIPED_BATCH_SIZE, run_repl, build_pipeline, stdin_is_piped
 from web import create_app
 from config import settings
 
@@ -45,8 +45,8 @@ def parse_args(argv: list[str] = None):
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=1,
-        help="Batch size for CLI mode.",
+        default=None,
+        help=f"Batch size for CLI mode (default: 1, or {PIPED_BATCH_SIZE} when stdin is piped).",
     )
     parser.add_argument(
         "--host",
@@ -61,7 +61,11 @@ def parse_args(argv: list[str] = None):
         help="Port for web mode.",
     )
     
-    return parser.parse_args(argv if argv is not None else sys.argv[1:])
+    args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+    if args.batch_size is None:
+        piped = args.mode == "cli" and stdin_is_piped()
+        args.batch_size = PIPED_BATCH_SIZE if piped else 1
+    return args
 
 
 def main(argv: list[str] = None) -> int:
@@ -89,7 +93,13 @@ def main(argv: list[str] = None) -> int:
     else:
         try:
             app = create_app(model=args.model, device=args.device)
-            uvicorn.run(app, host=args.host, port=args.port)
+            uvicorn.run(
+                app,
+                host=args.host,
+                port=args.port,
+                loop="uvloop",
+                http="httptools",
+            )
         except Exception as e:
             log.error(f"Failed to start web server: {e}")
             return 1
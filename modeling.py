@@ -14,9 +14,11 @@ Formulas implemented:
 
 from __future__ import annotations
 
+import hashlib
 import math
 import re
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 from typing import Any, Dict, List
 
 # ---------------------------------------------------------------------------
@@ -96,10 +98,15 @@ def compute_bow_matrix(
     vocabulary: List[str],
 ) -> List[List[int]]:
     """BoW(t, d) = count of term t in document d."""
+    index = {term: j for j, term in enumerate(vocabulary)}
     matrix = []
     for tokens in tokenized_docs:
-        counter = Counter(tokens)
-        matrix.append([counter.get(term, 0) for term in vocabulary])
+        row = [0] * len(vocabulary)
+        for term, count in Counter(tokens).items():
+            j = index.get(term)
+            if j is not None:
+                row[j] = count
+        matrix.append(row)
     return matrix
 
 
@@ -111,11 +118,18 @@ def compute_tf_matrix(
     vocabulary: List[str],
 ) -> List[List[float]]:
     """TF(t, d) = count(t, d) / total_tokens(d)."""
+    return _tf_from_bow(compute_bow_matrix(tokenized_docs, vocabulary), tokenized_docs)
+
+
+def _tf_from_bow(
+    bow_matrix: List[List[int]],
+    tokenized_docs: List[List[str]],
+) -> List[List[float]]:
+    """TF from already-computed BoW counts, avoiding a second counting pass."""
     matrix = []
-    for tokens in tokenized_docs:
-        counter = Counter(tokens)
+    for counts, tokens in zip(bow_matrix, tokenized_docs):
         total = len(tokens) if tokens else 1
-        matrix.append([round(counter.get(t, 0) / total, 4) for t in vocabulary])
+        matrix.append([round(c / total, 4) for c in counts])
     return matrix
 
 
@@ -127,10 +141,8 @@ def compute_df(
     vocabulary: List[str],
 ) -> Dict[str, int]:
     """DF(t) = number of documents that contain term t."""
-    return {
-        t: sum(1 for doc in tokenized_docs if t in set(doc))
-        for t in vocabulary
-    }
+    doc_freq = Counter(t for doc in tokenized_docs for t in set(doc))
+    return {t: doc_freq[t] for t in vocabulary}
 
 
 def compute_idf(df: Dict[str, int], n_docs: int) -> Dict[str, float]:
@@ -147,10 +159,11 @@ def compute_tfidf_matrix(
     vocabulary: List[str],
 ) -> List[List[float]]:
     """TF-IDF(t, d) = TF(t, d) × IDF(t)."""
+    idf_vec = [idf[t] for t in vocabulary]
     matrix = []
     for tf_row in tf_matrix:
         matrix.append([
-            round(tf * idf[vocabulary[j]], 4) for j, tf in enumerate(tf_row)
+            round(tf * w, 4) if tf else 0.0 for tf, w in zip(tf_row, idf_vec)
         ])
     return matrix
 
@@ -174,20 +187,45 @@ def l2_normalize(matrix: List[List[float]]) -> List[List[float]]:
 # Cosine similarity
 # ---------------------------------------------------------------------------
 def cosine_similarity_matrix(matrix: List[List[float]]) -> List[List[float]]:
-    """Pairwise cosine similarity: cos(A, B) = (A·B) / (‖A‖×‖B‖)."""
+    """Pairwise cosine similarity: cos(A, B) = (A·B) / (‖A‖×‖B‖).
+
+    Row norms are computed once up front and, since the matrix is
+    symmetric, only the upper triangle is evaluated and then mirrored.
+    """
     n = len(matrix)
-    sim: List[List[float]] = []
+    norms = [math.sqrt(sum(a ** 2 for a in row)) for row in matrix]
+    sim: List[List[float]] = [[0.0] * n for _ in range(n)]
     for i in range(n):
-        row: List[float] = []
-        for j in range(n):
-            dot = sum(a * b for a, b in zip(matrix[i], matrix[j]))
-            ni = math.sqrt(sum(a ** 2 for a in matrix[i]))
-            nj = math.sqrt(sum(b ** 2 for b in matrix[j]))
-            row.append(round(dot / (ni * nj), 4) if ni > 0 and nj > 0 else 0.0)
-        sim.append(row)
+        ni = norms[i]
+        for j in range(i, n):
+            nj = norms[j]
+            if ni > 0 and nj > 0:
+                dot = sum(a * b for a, b in zip(matrix[i], matrix[j]))
+                sim[i][j] = sim[j][i] = round(dot / (ni * nj), 4)
     return sim
 
 
+# ---------------------------------------------------------------------------
+# Result cache – the UI often re-runs the same corpus
+# ---------------------------------------------------------------------------
+_CACHE_SIZE = 16
+# Results keep several dense documents × vocabulary matrices plus the
+# documents × documents similarity matrix alive; larger ones are not cached.
+_CACHE_MAX_CELLS = 50_000
+_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_key(documents: List[str], *params: Any) -> bytes:
+    """Content hash of the corpus plus the modeling parameters."""
+    h = hashlib.blake2b(repr(params).encode(), digest_size=16)
+    for doc in documents:
+        raw = doc.encode()
+        h.update(len(raw).to_bytes(8, "little"))
+        h.update(raw)
+    return h.digest()
+
+
 # ---------------------------------------------------------------------------
 # Public API – full pipeline with intermediate steps
 # ---------------------------------------------------------------------------
@@ -201,7 +239,51 @@ def analyze_modeling(
 
     Returns a dict suitable for direct JSON serialisation with keys:
         method, features, data, steps, similarity_matrix, documents
+
+    Document × term matrices are shipped sparse, since they are mostly
+    zeros: each ``data`` row holds ``text`` plus ``indices`` into
+    ``features`` and the matching non-zero ``values``, and the
+    ``bow_matrix`` / ``tf_matrix`` / ``tfidf_raw`` / ``tfidf_normalized``
+    steps are lists of ``{"indices", "values"}`` rows.
+
+    The last ``_CACHE_SIZE`` results are memoized by corpus content and
+    parameters, skipping corpora whose matrices exceed ``_CACHE_MAX_CELLS``;
+    cached dicts are shared, so treat the result as read-only.
     """
+    key = _cache_key(documents, method, lowercase, remove_stopwords)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    result = _run_modeling(documents, method, lowercase, remove_stopwords)
+    n_docs = len(documents)
+    if n_docs * (len(result["features"]) + n_docs) > _CACHE_MAX_CELLS:
+        return result
+
+    with _cache_lock:
+        _cache[key] = result
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def _sparse_rows(matrix: List[List[float]]) -> List[Dict[str, list]]:
+    """Keep only the non-zero entries of each row as ``indices`` / ``values``."""
+    rows = []
+    for row in matrix:
+        indices = [j for j, v in enumerate(row) if v]
+        rows.append({"indices": indices, "values": [row[j] for j in indices]})
+    return rows
+
+
+def _run_modeling(
+    documents: List[str],
+    method: str,
+    lowercase: bool,
+    remove_stopwords: bool,
+) -> Dict[str, Any]:
+    """Uncached body of :func:`analyze_modeling`."""
     tokenized = [tokenize(doc, lowercase, remove_stopwords) for doc in documents]
     vocabulary = build_vocabulary(tokenized)
     bow = compute_bow_matrix(tokenized, vocabulary)
@@ -210,24 +292,24 @@ def analyze_modeling(
         "original_texts": documents,
         "tokenized_docs": tokenized,
         "vocabulary": vocabulary,
-        "bow_matrix": bow,
+        "bow_matrix": _sparse_rows(bow),
     }
 
     if method == "bow":
         final_matrix = bow
         float_matrix = [[float(v) for v in row] for row in bow]
     else:
-        tf = compute_tf_matrix(tokenized, vocabulary)
+        tf = _tf_from_bow(bow, tokenized)
         df_vals = compute_df(tokenized, vocabulary)
         idf_vals = compute_idf(df_vals, len(documents))
         tfidf_raw = compute_tfidf_matrix(tf, idf_vals, vocabulary)
         tfidf_norm = l2_normalize(tfidf_raw)
 
-        steps["tf_matrix"] = tf
+        steps["tf_matrix"] = _sparse_rows(tf)
         steps["df"] = df_vals
         steps["idf"] = idf_vals
-        steps["tfidf_raw"] = tfidf_raw
-        steps["tfidf_normalized"] = tfidf_norm
+        steps["tfidf_raw"] = _sparse_rows(tfidf_raw)
+        steps["tfidf_normalized"] = _sparse_rows(tfidf_norm)
 
         final_matrix = tfidf_norm
         float_matrix = tfidf_norm
@@ -235,8 +317,8 @@ def analyze_modeling(
     similarity = cosine_similarity_matrix(float_matrix)
 
     data = [
-        {"text": doc, "vector": final_matrix[i]}
-        for i, doc in enumerate(documents)
+        {"text": doc, **row}
+        for doc, row in zip(documents, _sparse_rows(final_matrix))
     ]
 
     return {
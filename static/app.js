@@ -178,7 +178,18 @@ document.addEventListener('DOMContentLoaded', () => {
             body: JSON.stringify({texts, method, lowercase, remove_stopwords}),
         });
         if (!res.ok) throw new Error('API xatolik');
-        return res.json();
+        return densifyRows(await res.json());
+    }
+
+    // Matrices arrive sparse (see sparse.js) — expand them once so every
+    // table/chart renderer can keep reading dense rows.
+    function densifyRows(r) {
+        const width = r.features.length;
+        r.data = r.data.map(row => ({text: row.text, vector: toDense(row, width)}));
+        ['bow_matrix', 'tf_matrix', 'tfidf_raw', 'tfidf_normalized'].forEach(key => {
+            if (r.steps[key]) r.steps[key] = r.steps[key].map(row => toDense(row, width));
+        });
+        return r;
     }
 
     // ------------------------------------------------------------------
@@ -59,7 +59,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
         // Body
         tableBody.innerHTML = result.data.map(row => {
-            const cells = row.vector.map(v => {
+            const cells = toDense(row, result.features.length).map(v => {
                 const opacity = v > 0 ? Math.min(0.1 + v, 0.8) : 0;
                 const style = v > 0 ? `style="background: rgba(108, 92, 231, ${opacity})"` : '';
                 return `<td class="val-cell" ${style}>${v}</td>`;
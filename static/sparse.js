@@ -0,0 +1,7 @@
+// Shared helper: /analyze_modeling ships document × term matrices as sparse
+// rows ({indices, values}); expand one back to a dense array for display.
+function toDense(row, width) {
+    const vector = new Array(width).fill(0);
+    row.indices.forEach((j, k) => { vector[j] = row.values[k]; });
+    return vector;
+}
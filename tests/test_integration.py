@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
+from cli import PIPED_BATCH_SIZE
 from main import main, parse_args
 
 
@@ -21,12 +22,23 @@ class _DummyPipeline:
 # ---------------------------------------------------------------------------
 
 def test_parse_defaults():
-    args = parse_args([])
+    with patch("main.sys.stdin.isatty", return_value=True):
+        args = parse_args([])
     assert args.mode == "cli"
     assert args.top_k == 1
     assert args.batch_size == 1
 
 
+def test_parse_piped_batch_size_default():
+    with patch("main.sys.stdin.isatty", return_value=False):
+        assert parse_args([]).batch_size == PIPED_BATCH_SIZE
+
+
+def test_parse_explicit_batch_size_respected_when_piped():
+    with patch("main.sys.stdin.isatty", return_value=False):
+        assert parse_args(["--batch-size", "4"]).batch_size == 4
+
+
 def test_parse_web_mode():
     args = parse_args(["--mode", "web", "--port", "8080"])
     assert args.mode == "web"
@@ -48,3 +60,16 @@ def test_invalid_batch_size():
 def test_model_load_failure():
     with patch("main.build_pipeline", side_effect=RuntimeError("boom")):
         assert main(["--model", "nonexistent"]) == 1
+
+
+def test_web_mode_runs_uvicorn_with_fast_backends():
+    with patch("main.create_app"), patch("main.uvicorn.run") as run:
+        assert main(["--mode", "web"]) == 0
+    assert run.call_args.kwargs["loop"] == "uvloop"
+    assert run.call_args.kwargs["http"] == "httptools"
+
+
+def test_web_mode_without_stdin():
+    with patch("main.sys.stdin", None), patch("cli.sys.stdin", None), \
+            patch("main.create_app"), patch("main.uvicorn.run"):
+        assert main(["--mode", "web"]) == 0
@@ -4,7 +4,28 @@ The DummyPipeline mock simulates both top_k-capable and legacy
 pipeline behaviour so tests run without downloading real models.
 """
 
-from cli import analyze_texts, format_outputs
+import dataclasses
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli import (
+    _to_gpu_precision,
+    analyze_texts,
+    build_pipeline,
+    format_outputs,
+    iter_inputs,
+)
+from config import settings
+
+
+@pytest.fixture(autouse=True)
+def _clear_pipeline_cache():
+    """Keep memoized pipelines from leaking between tests."""
+    build_pipeline.cache_clear()
+    yield
+    build_pipeline.cache_clear()
 
 
 class DummyPipeline:
@@ -64,3 +85,102 @@ def test_format_outputs_top_k():
     outputs = format_outputs(["great movie"], results, 2)
     assert "POSITIVE" in outputs[0]
     assert "NEGATIVE" in outputs[0]
+
+
+def test_build_pipeline_is_cached():
+    with patch("cli.AutoTokenizer") as tok, \
+            patch("cli.AutoModelForSequenceClassification"), \
+            patch("cli.pipeline", side_effect=lambda *a, **kw: object()):
+        first = build_pipeline("some-model", -1)
+        second = build_pipeline("some-model", -1)
+    assert first is second
+    tok.from_pretrained.assert_called_once_with("some-model", use_fast=True)
+
+
+def test_build_pipeline_onnx_falls_back_without_optimum():
+    onnx_settings = dataclasses.replace(settings, use_onnx=True)
+    with patch("cli.settings", onnx_settings), \
+            patch("cli._load_onnx_int8", side_effect=ImportError), \
+            patch("cli.AutoTokenizer"), \
+            patch("cli.AutoModelForSequenceClassification") as mdl, \
+            patch("cli.pipeline"):
+        build_pipeline("some-model", -1)
+    mdl.from_pretrained.assert_called_once_with("some-model", attn_implementation="sdpa")
+
+
+def test_build_pipeline_uses_onnx_model_on_cpu():
+    onnx_settings = dataclasses.replace(settings, use_onnx=True)
+    ort_model = object()
+    with patch("cli.settings", onnx_settings), \
+            patch("cli._load_onnx_int8", return_value=ort_model), \
+            patch("cli.AutoTokenizer"), \
+            patch("cli.AutoModelForSequenceClassification") as mdl, \
+            patch("cli.pipeline") as pipe:
+        build_pipeline("some-model", -1)
+    assert pipe.call_args.kwargs["model"] is ort_model
+    assert "device" not in pipe.call_args.kwargs
+    mdl.from_pretrained.assert_not_called()
+
+
+def test_build_pipeline_ignores_onnx_on_gpu():
+    onnx_settings = dataclasses.replace(settings, use_onnx=True)
+    with patch("cli.settings", onnx_settings), \
+            patch("cli._load_onnx_int8") as load_onnx, \
+            patch("cli._to_gpu_precision", side_effect=lambda mdl, device: mdl), \
+            patch("cli.AutoTokenizer"), \
+            patch("cli.AutoModelForSequenceClassification") as mdl, \
+            patch("cli.pipeline") as pipe:
+        build_pipeline("some-model", 0)
+    load_onnx.assert_not_called()
+    assert pipe.call_args.kwargs["model"] is mdl.from_pretrained.return_value
+    assert pipe.call_args.kwargs["device"] == 0
+
+
+def test_build_pipeline_falls_back_without_sdpa():
+    with patch("cli.AutoTokenizer"), \
+            patch("cli.AutoModelForSequenceClassification") as mdl, \
+            patch("cli.pipeline"):
+        mdl.from_pretrained.side_effect = [ValueError("no sdpa"), object()]
+        build_pipeline("some-model", -1)
+    assert mdl.from_pretrained.call_count == 2
+    mdl.from_pretrained.assert_called_with("some-model")
+
+
+def test_iter_inputs_piped(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("good\n\nbad\nexit\nignored\n"))
+    assert list(iter_inputs(1)) == [["good"], ["bad"]]
+
+
+def test_iter_inputs_without_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", None)
+    assert list(iter_inputs(1)) == []
+
+
+def _fake_torch(cuda_available=True, bf16_supported=True):
+    torch = MagicMock()
+    torch.cuda.is_available.return_value = cuda_available
+    torch.cuda.is_bf16_supported.return_value = bf16_supported
+    return torch
+
+
+def test_to_gpu_precision_cpu_unchanged():
+    mdl = MagicMock()
+    with patch.dict("sys.modules", {"torch": _fake_torch()}):
+        assert _to_gpu_precision(mdl, -1) is mdl
+    mdl.to.assert_not_called()
+
+
+def test_to_gpu_precision_without_cuda_unchanged():
+    mdl = MagicMock()
+    with patch.dict("sys.modules", {"torch": _fake_torch(cuda_available=False)}):
+        assert _to_gpu_precision(mdl, 0) is mdl
+    mdl.to.assert_not_called()
+
+
+def test_to_gpu_precision_casts_to_bf16():
+    mdl = MagicMock()
+    torch = _fake_torch()
+    with patch.dict("sys.modules", {"torch": torch}):
+        assert _to_gpu_precision(mdl, 1) is mdl.to.return_value
+    torch.cuda.device.assert_called_once_with(1)
+    mdl.to.assert_called_once_with(torch.bfloat16)
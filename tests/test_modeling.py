@@ -0,0 +1,120 @@
+"""Unit tests for the from-scratch BoW / TF-IDF module (modeling.py)."""
+
+import math
+from unittest.mock import patch
+
+import modeling
+from modeling import (
+    analyze_modeling,
+    compute_bow_matrix,
+    compute_df,
+    compute_idf,
+    compute_tf_matrix,
+    compute_tfidf_matrix,
+    cosine_similarity_matrix,
+)
+
+DOCS = [["cat", "dog", "cat"], ["dog", "bird"], [], ["fish"]]
+VOCAB = ["bird", "cat", "dog", "fish"]
+
+
+# ---------------------------------------------------------------------------
+# Bag of Words & Term Frequency
+# ---------------------------------------------------------------------------
+
+def test_compute_bow_matrix_counts_terms():
+    assert compute_bow_matrix(DOCS, VOCAB) == [
+        [0, 2, 1, 0],
+        [1, 0, 1, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 1],
+    ]
+
+
+def test_compute_bow_matrix_skips_terms_outside_vocabulary():
+    assert compute_bow_matrix([["a", "b", "c"]], ["a", "b"]) == [[1, 1]]
+
+
+def test_compute_tf_matrix_divides_by_document_length():
+    tf = compute_tf_matrix(DOCS, VOCAB)
+    expected = [
+        [round(doc.count(t) / (len(doc) or 1), 4) for t in VOCAB] for doc in DOCS
+    ]
+    assert tf == expected
+    assert tf[0] == [0.0, 0.6667, 0.3333, 0.0]
+    assert tf[2] == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_compute_tf_matrix_restricted_vocabulary():
+    assert compute_tf_matrix([["a", "b", "c"]], ["a", "b"]) == [[0.3333, 0.3333]]
+
+
+# ---------------------------------------------------------------------------
+# Document frequency
+# ---------------------------------------------------------------------------
+
+def test_compute_df_matches_definition():
+    expected = {t: sum(1 for doc in DOCS if t in doc) for t in VOCAB}
+    assert compute_df(DOCS, VOCAB) == expected == {"bird": 1, "cat": 1, "dog": 2, "fish": 1}
+
+
+# ---------------------------------------------------------------------------
+# TF-IDF
+# ---------------------------------------------------------------------------
+
+def test_compute_tfidf_matrix_matches_per_cell_product():
+    tf = compute_tf_matrix(DOCS, VOCAB)
+    idf = compute_idf(compute_df(DOCS, VOCAB), len(DOCS))
+    expected = [
+        [round(v * idf[VOCAB[j]], 4) for j, v in enumerate(row)] for row in tf
+    ]
+    assert compute_tfidf_matrix(tf, idf, VOCAB) == expected
+
+
+# ---------------------------------------------------------------------------
+# Cosine similarity
+# ---------------------------------------------------------------------------
+
+def test_cosine_similarity_matches_pairwise_formula():
+    matrix = [[0.5, 0.0, 0.8], [0.5, 0.0, 0.8], [0.0, 1.0, 0.0], [0.0, 0.0, 0.0]]
+    expected = []
+    for a in matrix:
+        row = []
+        for b in matrix:
+            dot = sum(x * y for x, y in zip(a, b))
+            na = math.sqrt(sum(x ** 2 for x in a))
+            nb = math.sqrt(sum(y ** 2 for y in b))
+            row.append(round(dot / (na * nb), 4) if na > 0 and nb > 0 else 0.0)
+        expected.append(row)
+    assert cosine_similarity_matrix(matrix) == expected
+
+
+def test_analyze_modeling_tfidf_similarity():
+    sim = analyze_modeling(["cat dog", "cat dog", "bird"])["similarity_matrix"]
+    assert sim[0][1] == 1.0
+    assert sim[0][2] == 0.0
+    assert sim[1][0] == sim[0][1]
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+def test_analyze_modeling_is_cached():
+    modeling._cache.clear()
+    first = analyze_modeling(["cache me", "please"], method="bow")
+    second = analyze_modeling(["cache me", "please"], method="bow")
+    other = analyze_modeling(["cache me", "please"], method="tfidf")
+    assert first is second
+    assert other is not first
+    assert len(modeling._cache) == 2
+
+
+def test_analyze_modeling_skips_cache_for_large_corpora():
+    modeling._cache.clear()
+    with patch("modeling._CACHE_MAX_CELLS", 5):
+        first = analyze_modeling(["one two three", "four five six"])
+        second = analyze_modeling(["one two three", "four five six"])
+    assert first is not second
+    assert first == second
+    assert not modeling._cache
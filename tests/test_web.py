@@ -4,12 +4,19 @@ Uses the FastAPI TestClient with a DummyPipeline so that no real
 model download is needed.
 """
 
+import asyncio
+import dataclasses
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-from web import create_app
+from config import settings
+import web
+from web import _batch_worker, create_app
 
 
 # ---------------------------------------------------------------------------
@@ -107,11 +114,153 @@ def test_analyze_text_too_long(client):
     assert res.status_code == 422
 
 
+def test_analyze_rounds_scores(client):
+    res = client.post("/analyze", json={"texts": ["Test"], "top_k": 2})
+    scores = [s["score"] for s in res.json()["results"][0]["sentiments"]]
+    assert scores == [0.95, 0.05]
+
+
+class _TiePipeline:
+    def __call__(self, texts, top_k=None):
+        return [{"label": "NEGATIVE", "score": 0.00035} for _ in texts]
+
+
+def test_analyze_rounds_like_builtin_round():
+    with patch("web.build_pipeline", return_value=_TiePipeline()):
+        with TestClient(create_app(model="test-model", device=-1)) as c:
+            res = c.post("/analyze", json={"texts": ["Tie"]})
+    assert res.json()["results"][0]["sentiments"][0]["score"] == round(0.00035, 4)
+
+
 def test_analyze_returns_elapsed(client):
     res = client.post("/analyze", json={"texts": ["Fast"]})
     assert "elapsed_ms" in res.json()
 
 
+# ---------------------------------------------------------------------------
+# POST /analyze_modeling
+# ---------------------------------------------------------------------------
+
+def test_modeling_returns_sparse_vectors(client):
+    res = client.post(
+        "/analyze_modeling",
+        json={"texts": ["cat dog", "dog bird"], "method": "bow"},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["features"] == ["bird", "cat", "dog"]
+    assert body["data"][0]["indices"] == [1, 2]
+    assert body["data"][0]["values"] == [1.0, 1.0]
+    assert body["data"][1]["indices"] == [0, 2]
+    assert body["steps"]["bow_matrix"][0] == {"indices": [1, 2], "values": [1, 1]}
+
+
+# ---------------------------------------------------------------------------
+# Micro-batching
+# ---------------------------------------------------------------------------
+
+class _CountingPipeline(_DummyPipeline):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, top_k=None):
+        self.calls.append(list(texts))
+        return super().__call__(texts, top_k=top_k)
+
+
+class _FailingOnBadPipeline(_CountingPipeline):
+    def __call__(self, texts, top_k=None):
+        if "bad" in texts:
+            self.calls.append(list(texts))
+            raise RuntimeError("sequence too long")
+        return super().__call__(texts, top_k=top_k)
+
+
+def _run_worker(nlp, *items):
+    """Queue ``(texts, top_k)`` items, run the batch worker until all resolve.
+
+    Returns the finished futures in queue order.
+    """
+    async def _run():
+        loop = asyncio.get_running_loop()
+        state = SimpleNamespace(
+            nlp=nlp,
+            queue=asyncio.Queue(),
+            inference_executor=ThreadPoolExecutor(max_workers=1),
+        )
+        futures = []
+        for texts, top_k in items:
+            futures.append(loop.create_future())
+            await state.queue.put((texts, top_k, futures[-1]))
+        worker = asyncio.create_task(_batch_worker(SimpleNamespace(state=state)))
+        try:
+            await asyncio.wait(futures)
+        finally:
+            worker.cancel()
+            state.inference_executor.shutdown()
+        return futures
+
+    return asyncio.run(_run())
+
+
+def test_batch_worker_coalesces_requests():
+    nlp = _CountingPipeline()
+    f1, f2 = _run_worker(nlp, (["a", "b"], 1), (["c"], 1))
+    assert nlp.calls == [["a", "b", "c"]]
+    (r1, k1), (r2, k2) = f1.result(), f2.result()
+    assert len(r1) == 2 and len(r2) == 1
+    assert k1 == k2 == 1
+
+
+def test_batch_worker_respects_max_batch_size():
+    nlp = _CountingPipeline()
+    with patch("web.settings", dataclasses.replace(settings, max_batch_size=3)):
+        f1, f2 = _run_worker(nlp, (["a", "b"], 1), (["c", "d"], 1))
+    assert nlp.calls == [["a", "b"], ["c", "d"]]
+    assert len(f1.result()[0]) == 2 and len(f2.result()[0]) == 2
+
+
+def test_batch_worker_isolates_failing_request():
+    nlp = _FailingOnBadPipeline()
+    good, bad = _run_worker(nlp, (["fine"], 1), (["bad"], 1))
+    assert nlp.calls[0] == ["fine", "bad"]
+    assert good.result()[0] == [{"label": "POSITIVE", "score": 0.95}]
+    assert isinstance(bad.exception(), RuntimeError)
+
+
+def test_batch_worker_survives_unexpected_error():
+    real_run_batch = web._run_batch
+    calls = []
+
+    async def _flaky_run_batch(app, batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        await real_run_batch(app, batch)
+
+    one_per_batch = dataclasses.replace(settings, max_batch_size=1)
+    with patch("web.settings", one_per_batch), \
+            patch("web._run_batch", _flaky_run_batch):
+        f1, f2 = _run_worker(_CountingPipeline(), (["a"], 1), (["b"], 1))
+    assert isinstance(f1.exception(), RuntimeError)
+    assert f2.result()[0] == [{"label": "POSITIVE", "score": 0.95}]
+
+
+class _HangingPipeline:
+    def __call__(self, texts, top_k=None):
+        time.sleep(0.5)
+        return [{"label": "POSITIVE", "score": 0.95} for _ in texts]
+
+
+def test_analyze_times_out():
+    short = dataclasses.replace(settings, request_timeout=0.05)
+    with patch("web.build_pipeline", return_value=_HangingPipeline()), \
+            patch("web.settings", short):
+        with TestClient(create_app(model="test-model", device=-1)) as c:
+            res = c.post("/analyze", json={"texts": ["Slow"]})
+    assert res.status_code == 504
+
+
 # ---------------------------------------------------------------------------
 # Frontend
 # ---------------------------------------------------------------------------
@@ -12,15 +12,19 @@ In practice this module is started via ``main.py --mode web``.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, field_validator
 
@@ -115,7 +119,8 @@ class ModelingRequest(BaseModel):
 
 class ModelingResultRow(BaseModel):
     text: str
-    vector: List[float]
+    indices: List[int]
+    values: List[float]
 
 class ModelingResponse(BaseModel):
     method: str
@@ -126,6 +131,105 @@ class ModelingResponse(BaseModel):
     documents: List[str] = Field(default_factory=list)
 
 
+# ---------------------------------------------------------------------------
+# Micro-batching worker
+# ---------------------------------------------------------------------------
+
+async def _run_batch(app: FastAPI, batch: list) -> None:
+    """Run one coalesced batch and scatter results to the waiting futures.
+
+    Items are grouped by ``top_k`` so every group is a single pipeline call.
+    If a shared call fails, each item of that group is retried on its own
+    so the error only reaches the request that caused it.
+    Inference runs on ``app.state.inference_executor`` so the event loop
+    stays responsive; futures are resolved back on the loop thread.
+    Each future receives ``(raw_results, effective_top_k)`` for its own texts.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def _infer(texts: list, top_k: int):
+        return await loop.run_in_executor(
+            app.state.inference_executor,
+            analyze_texts, app.state.nlp, texts, top_k,
+        )
+
+    groups: dict[int, list] = {}
+    for item in batch:
+        groups.setdefault(item[1], []).append(item)
+
+    for top_k, items in groups.items():
+        flat_texts = [text for texts, _, _ in items for text in texts]
+        try:
+            raw_results, effective_top_k = await _infer(flat_texts, top_k)
+        except Exception as exc:
+            if len(items) == 1:
+                _, _, fut = items[0]
+                if not fut.done():
+                    fut.set_exception(exc)
+                continue
+            for texts, _, fut in items:
+                try:
+                    result = await _infer(texts, top_k)
+                except Exception as item_exc:
+                    if not fut.done():
+                        fut.set_exception(item_exc)
+                else:
+                    if not fut.done():
+                        fut.set_result(result)
+            continue
+
+        offset = 0
+        for texts, _, fut in items:
+            chunk = raw_results[offset:offset + len(texts)]
+            offset += len(texts)
+            if not fut.done():
+                fut.set_result((chunk, effective_top_k))
+
+
+async def _batch_worker(app: FastAPI) -> None:
+    """Coalesce queued ``/analyze`` requests into shared forward passes.
+
+    Blocks on the first queued item, then keeps draining the queue until
+    ``settings.max_batch_size`` texts are collected or
+    ``settings.batch_wait_ms`` elapses, whichever comes first.  An item
+    that would push the batch past the limit starts the next batch instead.
+    """
+    queue: asyncio.Queue = app.state.queue
+    loop = asyncio.get_running_loop()
+    wait_s = settings.batch_wait_ms / 1000
+    pending = None
+
+    while True:
+        first = pending if pending is not None else await queue.get()
+        pending = None
+        batch = [first]
+        n_texts = len(first[0])
+        deadline = loop.time() + wait_s
+
+        while n_texts < settings.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if n_texts + len(item[0]) > settings.max_batch_size:
+                pending = item
+                break
+            batch.append(item)
+            n_texts += len(item[0])
+
+        try:
+            await _run_batch(app, batch)
+        except Exception as exc:
+            # Keep the worker alive; only this batch's requests fail.
+            log.exception("Batch worker error")
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+
 # ---------------------------------------------------------------------------
 # Application factory
 # ---------------------------------------------------------------------------
@@ -153,7 +257,21 @@ def create_app(
         except Exception as exc:
             log.error("Failed to load model '%s': %s", model, exc)
             raise RuntimeError(f"Model load failed: {exc}") from exc
-        yield
+
+        # A single inference thread keeps torch calls serialised while the
+        # event loop keeps serving /health and other endpoints.
+        app.state.inference_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="inference"
+        )
+        app.state.queue = asyncio.Queue()
+        worker = asyncio.create_task(_batch_worker(app))
+        try:
+            yield
+        finally:
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+            app.state.inference_executor.shutdown(wait=False)
 
     app = FastAPI(
         title="NLP Sentiment API",
@@ -163,16 +281,17 @@ def create_app(
     )
 
     # -- CORS ----------------------------------------------------------------
-    origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins,
+        allow_origins=list(settings.origins_list),
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
     # -- State ---------------------------------------------------------------
     app.state.nlp = None  # set by lifespan
+    app.state.queue = None  # set by lifespan
+    app.state.inference_executor = None  # set by lifespan
     app.state.model_name = model
     app.state.device = device
     app.state.top_k_supported = True
@@ -180,10 +299,11 @@ def create_app(
     # -- Middleware: request timing ------------------------------------------
     @app.middleware("http")
     async def _timeout_middleware(request: Request, call_next):
-        start = time.time()
+        # Monotonic clock: immune to wall-clock adjustments.
+        start = time.perf_counter_ns()
         response = await call_next(request)
-        elapsed = time.time() - start
-        response.headers["X-Process-Time-Ms"] = f"{elapsed * 1000:.1f}"
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        response.headers["X-Process-Time-Ms"] = f"{elapsed_ms:.1f}"
         return response
 
     # -- Routes --------------------------------------------------------------
@@ -231,11 +351,15 @@ def create_app(
         if app.state.nlp is None:
             raise HTTPException(status_code=503, detail="Model is still loading.")
 
-        start = time.time()
+        start = time.perf_counter_ns()
+        fut = asyncio.get_running_loop().create_future()
+        await app.state.queue.put((body.texts, body.top_k, fut))
         try:
-            raw_results, effective_top_k = analyze_texts(
-                app.state.nlp, body.texts, body.top_k
+            raw_results, effective_top_k = await asyncio.wait_for(
+                fut, timeout=settings.request_timeout
             )
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Inference timed out.")
         except Exception as exc:
             log.exception("Inference error")
             raise HTTPException(status_code=500, detail=f"Inference failed: {exc}")
@@ -243,36 +367,42 @@ def create_app(
         if effective_top_k < body.top_k:
             app.state.top_k_supported = False
 
-        # Normalise results into a uniform list-of-lists shape.
-        results: list[TextResult] = []
+        # Normalise results into a uniform list-of-lists shape.  Plain dicts
+        # go straight to orjson, skipping Pydantic/jsonable_encoder; the
+        # response_model above still documents the schema.
+        results = []
         for text, raw in zip(body.texts, raw_results):
             if isinstance(raw, dict):
-                sentiments = [SentimentResult(label=raw["label"], score=round(raw["score"], 4))]
-            else:
-                sentiments = [
-                    SentimentResult(label=r["label"], score=round(r["score"], 4))
-                    for r in raw
-                ]
-            results.append(TextResult(text=text, sentiments=sentiments))
-
-        elapsed_ms = (time.time() - start) * 1000
-        return AnalyzeResponse(
-            results=results,
-            model=app.state.model_name,
-            elapsed_ms=round(elapsed_ms, 1),
-        )
+                raw = [raw]
+            results.append({
+                "text": text,
+                "sentiments": [
+                    {"label": r["label"], "score": round(r["score"], 4)} for r in raw
+                ],
+            })
+
+        elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+        payload = {
+            "results": results,
+            "model": app.state.model_name,
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
+        return Response(orjson.dumps(payload), media_type="application/json")
 
     @app.post("/analyze_modeling", response_model=ModelingResponse, tags=["modeling"])
     async def _modeling(body: ModelingRequest):
         """Perform BoW or TF-IDF modeling on a list of documents."""
         try:
-            result = analyze_modeling(
+            result = await asyncio.to_thread(
+                analyze_modeling,
                 body.texts,
                 method=body.method,
                 lowercase=body.lowercase,
                 remove_stopwords=body.remove_stopwords,
             )
-            return ModelingResponse(**result)
+            # Output of our own pipeline — skip re-validating every cell.
+            rows = [ModelingResultRow.model_construct(**row) for row in result["data"]]
+            return ModelingResponse.model_construct(**{**result, "data": rows})
         except Exception as exc:
             log.exception("Modeling error")
             raise HTTPException(status_code=500, detail=f"Modeling failed: {exc}")